@@ -18,6 +18,7 @@
 #        Tiago Gomes <tiago.gomes@codethink.co.uk>
 
 import os
+import threading
 
 from .exceptions import ErrorDomain
 
@@ -25,7 +26,11 @@ from .exceptions import ErrorDomain
 # pylint: disable=global-statement
 
 # The last raised exception, this is used in test cases only
-_last_exception = None
+#
+# This is thread local, so that errors raised while running jobs
+# in the scheduler's worker threads do not clobber the last error
+# raised in the main thread.
+_last_exception = threading.local()
 _last_task_error_domain = None
 _last_task_error_reason = None
 
@@ -37,10 +42,8 @@ _last_task_error_reason = None
 # Used by regression tests
 #
 def get_last_exception():
-    global _last_exception
-
-    le = _last_exception
-    _last_exception = None
+    le = getattr(_last_exception, "value", None)
+    _last_exception.value = None
     return le
 
 
@@ -88,8 +91,6 @@ def set_last_task_error(domain, reason):
 #
 class BstError(Exception):
     def __init__(self, message, *, detail=None, domain=None, reason=None, temporary=False):
-        global _last_exception
-
         super().__init__(message)
 
         # Additional error detail, these are used to construct detail
@@ -112,7 +113,7 @@ class BstError(Exception):
 
         # Hold on to the last raised exception for testing purposes
         if "BST_TEST_SUITE" in os.environ:
-            _last_exception = self
+            _last_exception.value = self
 
 
 # PluginError
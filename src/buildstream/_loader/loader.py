@@ -513,8 +513,7 @@ class Loader:
                         dep_deps = extract_depends_from_node(dep_element.node)
                         loader_queue.append((dep_element, list(reversed(dep_deps)), []))
 
-                        # Pylint is not very happy about Cython and can't understand 'node' is a 'MappingNode'
-                        if dep_element.node.get_str(Symbol.KIND) == "junction":  # pylint: disable=no-member
+                        if dep_element.kind == "junction":
                             raise LoadError(
                                 "{}: Cannot depend on junction".format(dep.node.get_provenance()),
                                 LoadErrorReason.INVALID_DATA,
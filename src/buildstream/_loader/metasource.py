@@ -19,6 +19,8 @@
 
 class MetaSource:
 
+    __slots__ = ["element_name", "element_index", "element_kind", "kind", "config", "directory", "first_pass"]
+
     # MetaSource()
     #
     # An abstract object holding data suitable for constructing a Source
@@ -20,7 +20,6 @@
 #        Tristan Maat <tristan.maat@codethink.co.uk>
 
 # System imports
-import asyncio
 import datetime
 import itertools
 import threading
@@ -153,13 +152,7 @@ class Job:
             self._message_element_key,
         )
 
-        loop = asyncio.get_event_loop()
-
-        async def execute():
-            ret_code, self._result = await loop.run_in_executor(None, self._child.child_action)
-            await self._parent_child_completed(ret_code)
-
-        self._task = loop.create_task(execute())
+        self._task = self._scheduler.loop.create_task(self._execute())
 
     # terminate()
     #
@@ -219,15 +212,9 @@ class Job:
     #            override 'element_name' and 'element_key' this way.
     #
     def message(self, message_type, message, **kwargs):
+        kwargs = {"element_name": self._message_element_name, "element_key": self._message_element_key, **kwargs}
         kwargs["scheduler"] = True
-        message = Message(
-            message_type,
-            message,
-            element_name=self._message_element_name,
-            element_key=self._message_element_key,
-            **kwargs
-        )
-        self._messenger.message(message)
+        self._messenger.message(Message(message_type, message, **kwargs))
 
     # get_element()
     #
@@ -278,6 +265,15 @@ class Job:
     #                  Local Private Methods              #
     #######################################################
 
+    # _execute()
+    #
+    # Runs the child action in the scheduler's executor and
+    # handles its completion in the main thread.
+    #
+    async def _execute(self):
+        ret_code, self._result = await self._scheduler.loop.run_in_executor(None, self._child.child_action)
+        await self._parent_child_completed(ret_code)
+
     # _parent_child_completed()
     #
     # Called in the main process courtesy of asyncio's ChildWatcher.add_child_handler()
@@ -298,7 +294,7 @@ class Job:
             returncode = _ReturnCode.PERM_FAIL
 
         # We don't want to retry if we got OK or a permanent fail.
-        retry_flag = returncode == _ReturnCode.FAIL
+        retry_flag = returncode is _ReturnCode.FAIL
 
         if retry_flag and (self._tries <= self._max_retries) and not self._scheduler.terminated:
             self.start()
@@ -306,13 +302,13 @@ class Job:
 
         # Resolve the outward facing overall job completion status
         #
-        if returncode == _ReturnCode.OK:
+        if returncode is _ReturnCode.OK:
             status = JobStatus.OK
-        elif returncode == _ReturnCode.SKIPPED:
+        elif returncode is _ReturnCode.SKIPPED:
             status = JobStatus.SKIPPED
-        elif returncode in (_ReturnCode.FAIL, _ReturnCode.PERM_FAIL):
+        elif returncode is _ReturnCode.FAIL or returncode is _ReturnCode.PERM_FAIL:
             status = JobStatus.FAIL
-        elif returncode == _ReturnCode.TERMINATED:
+        elif returncode is _ReturnCode.TERMINATED:
             if self._terminated:
                 self.message(MessageType.INFO, "Job terminated")
             else:
@@ -383,16 +379,9 @@ class ChildJob:
     #            overriden here.
     #
     def message(self, message_type, message, **kwargs):
+        kwargs = {"element_name": self._message_element_name, "element_key": self._message_element_key, **kwargs}
         kwargs["scheduler"] = True
-        self._messenger.message(
-            Message(
-                message_type,
-                message,
-                element_name=self._message_element_name,
-                element_key=self._message_element_key,
-                **kwargs
-            )
-        )
+        self._messenger.message(Message(message_type, message, **kwargs))
 
     #######################################################
     #                  Abstract Methods                   #
@@ -432,7 +421,7 @@ class ChildJob:
                 self.message(MessageType.START, self.action_name, logfile=filename)
 
                 with self._terminate_lock:
-                    self._thread_id = threading.current_thread().ident
+                    self._thread_id = threading.get_ident()
                     if self._should_terminate:
                         return _ReturnCode.TERMINATED, None
 
@@ -184,12 +184,18 @@ class Queue:
         if not elts:
             return
 
+        enqueue_element = self._enqueue_element
+
         # Obtain immediate element status
-        for elt in elts:
-            if self._required_element_check and not elt._is_required():
-                elt._set_required_callback(self._enqueue_element)
-            else:
-                self._enqueue_element(elt)
+        if self._required_element_check:
+            for elt in elts:
+                if elt._is_required():
+                    enqueue_element(elt)
+                else:
+                    elt._set_required_callback(enqueue_element)
+        else:
+            for elt in elts:
+                enqueue_element(elt)
 
     # dequeue()
     #
@@ -21,6 +21,21 @@ This package contains various utilities which make it easier to test plugins.
 import os
 from collections import OrderedDict
 from typing import Tuple
+
+# To make use of these test utilities it is necessary to have pytest
+# available. However, we don't want to have a hard dependency on
+# pytest.
+#
+# This check must come before importing the submodules below, which
+# import pytest themselves and pull in the whole frontend.
+try:
+    import pytest
+except ImportError:
+    module_name = globals()["__name__"]
+    msg = "Could not import pytest:\n" "To use the {} module, you must have pytest installed.".format(module_name)
+    raise ImportError(msg)
+
+# pylint: disable=wrong-import-position
 from buildstream.exceptions import ErrorDomain, LoadErrorReason
 from ._yaml import generate_project, generate_element, load_yaml
 from .repo import Repo
@@ -35,16 +50,6 @@ __all__ = [
     "sourcetests_collection_hook",
 ]
 
-# To make use of these test utilities it is necessary to have pytest
-# available. However, we don't want to have a hard dependency on
-# pytest.
-try:
-    import pytest
-except ImportError:
-    module_name = globals()["__name__"]
-    msg = "Could not import pytest:\n" "To use the {} module, you must have pytest installed.".format(module_name)
-    raise ImportError(msg)
-
 
 # Of the form plugin_name -> (repo_class, plugin_package)
 ALL_REPO_KINDS = OrderedDict()  # type: OrderedDict[str, Tuple[Repo, str]]
@@ -24,7 +24,7 @@ import tarfile as tarfilelib
 from tarfile import TarFile
 from contextlib import contextmanager
 from io import StringIO, BytesIO
-from typing import Callable, Optional, Union, List, IO, Iterator, Dict
+from typing import Any, Callable, Optional, Union, List, IO, Iterator, Dict, Tuple
 
 from google.protobuf import timestamp_pb2
 
@@ -40,6 +40,8 @@ from ..utils import FileListResult, BST_ARBITRARY_TIMESTAMP
 # An object to represent a file, used to track members of a CasBasedDirectory
 #
 class _IndexEntry:
+    __slots__ = ["cas_cache", "name", "type", "digest", "target", "is_executable", "directory", "mtime"]
+
     def __init__(
         self,
         cas_cache: CASCache,
@@ -149,6 +151,9 @@ class CasBasedDirectory(Directory):
         # The parent directory
         self.__parent: Optional["CasBasedDirectory"] = parent
 
+        # The root directory of the tree this directory belongs to
+        self.__root: "CasBasedDirectory" = parent.__root if parent else self
+
         # An index of directory entries
         self.__index: Dict[str, _IndexEntry] = {}
 
@@ -544,42 +549,81 @@ class CasBasedDirectory(Directory):
     #
     def _get_digest(self):
         if not self.__digest:
-            # Create updated Directory proto
-            pb2_directory = remote_execution_pb2.Directory()
+            # Serialize this directory and all modified subdirectories,
+            # and then store them all in CAS with a single request.
+            updates: List[Tuple["CasBasedDirectory", bytes, Any]] = []
+            self.__serialize_tree(updates)
+
+            digests = self.__cas_cache.add_objects(buffers=[buffer for _, buffer, _ in updates])
+
+            # Parent directories were serialized with the locally calculated
+            # digests of their subdirectories, so these must match what casd
+            # has stored.
+            for (directory, _, digest), stored_digest in zip(updates, digests):
+                assert digest == stored_digest, "Digest mismatch for {}: calculated {}, stored {}".format(
+                    directory, digest.hash, stored_digest.hash
+                )
+                directory.__digest = stored_digest
 
-            if self.__subtree_read_only is not None:
-                node_property = pb2_directory.node_properties.properties.add()
-                node_property.name = "SubtreeReadOnly"
-                node_property.value = "true" if self.__subtree_read_only else "false"
+        return self.__digest
 
-            for name, entry in sorted(self.__index.items()):
-                if entry.type == FileType.DIRECTORY:
-                    dirnode = pb2_directory.directories.add()
-                    dirnode.name = name
-
-                    # Update digests for subdirectories in DirectoryNodes.
-                    # No need to call entry.get_directory().
-                    # If it hasn't been instantiated, digest must be up-to-date.
-                    subdir = entry.directory
-                    if subdir is not None:
-                        dirnode.digest.CopyFrom(subdir._get_digest())
-                    else:
-                        dirnode.digest.CopyFrom(entry.digest)
-                elif entry.type == FileType.REGULAR_FILE:
-                    filenode = pb2_directory.files.add()
-                    filenode.name = name
-                    filenode.digest.CopyFrom(entry.digest)
-                    filenode.is_executable = entry.is_executable
-                    if entry.mtime is not None:
-                        filenode.node_properties.mtime.CopyFrom(entry.mtime)
-                elif entry.type == FileType.SYMLINK:
-                    symlinknode = pb2_directory.symlinks.add()
-                    symlinknode.name = name
-                    symlinknode.target = entry.target
-
-            self.__digest = self.__cas_cache.add_object(buffer=pb2_directory.SerializeToString())
+    # __serialize_tree()
+    #
+    # Serialize this directory into a Directory proto, recursing into
+    # any instantiated subdirectories whose digest is not up-to-date.
+    #
+    # The digests are calculated here but not stored on the directories,
+    # the caller is responsible for adding the serialized buffers to CAS
+    # and then assigning the digests.
+    #
+    # Args:
+    #    updates: A list to append (directory, buffer, digest) tuples to,
+    #             subdirectories are appended before their parents
+    #
+    # Returns:
+    #   (Digest): The Digest protobuf object for the Directory protobuf
+    #
+    def __serialize_tree(self, updates: List[Tuple["CasBasedDirectory", bytes, Any]]):
+        # Create updated Directory proto
+        pb2_directory = remote_execution_pb2.Directory()
 
-        return self.__digest
+        if self.__subtree_read_only is not None:
+            node_property = pb2_directory.node_properties.properties.add()
+            node_property.name = "SubtreeReadOnly"
+            node_property.value = "true" if self.__subtree_read_only else "false"
+
+        for name, entry in sorted(self.__index.items()):
+            if entry.type == FileType.DIRECTORY:
+                dirnode = pb2_directory.directories.add()
+                dirnode.name = name
+
+                # Update digests for subdirectories in DirectoryNodes.
+                # No need to call entry.get_directory().
+                # If it hasn't been instantiated, digest must be up-to-date.
+                subdir = entry.directory
+                if subdir is None:
+                    dirnode.digest.CopyFrom(entry.digest)
+                elif subdir.__digest:
+                    dirnode.digest.CopyFrom(subdir.__digest)
+                else:
+                    dirnode.digest.CopyFrom(subdir.__serialize_tree(updates))
+            elif entry.type == FileType.REGULAR_FILE:
+                filenode = pb2_directory.files.add()
+                filenode.name = name
+                filenode.digest.CopyFrom(entry.digest)
+                filenode.is_executable = entry.is_executable
+                if entry.mtime is not None:
+                    filenode.node_properties.mtime.CopyFrom(entry.mtime)
+            elif entry.type == FileType.SYMLINK:
+                symlinknode = pb2_directory.symlinks.add()
+                symlinknode.name = name
+                symlinknode.target = entry.target
+
+        buffer = pb2_directory.SerializeToString()
+        digest = utils._message_digest(buffer)
+        updates.append((self, buffer, digest))
+
+        return digest
 
     # __open_directory()
     #
@@ -843,18 +887,29 @@ class CasBasedDirectory(Directory):
     #    ist of all files with relative paths.
     #
     def __list_prefixed_relative_paths(self, prefix: str = "") -> Iterator[str]:
-        file_list = list(filter(lambda i: i[1].type != FileType.DIRECTORY, self.__index.items()))
-        directory_list = filter(lambda i: i[1].type == FileType.DIRECTORY, self.__index.items())
+        # Walk the tree depth first with an explicit stack, subdirectories
+        # are pushed in reverse order so that they are popped in sorted order.
+        stack = [(self, prefix)]
+        while stack:
+            directory, prefix = stack.pop()
+
+            file_list = []
+            directory_list = []
+            for name, entry in directory.__index.items():
+                if entry.type == FileType.DIRECTORY:
+                    directory_list.append(name)
+                else:
+                    file_list.append(name)
 
-        if prefix != "":
-            yield prefix
+            if prefix != "":
+                yield prefix
 
-        for (k, v) in sorted(file_list):
-            yield os.path.join(prefix, k)
+            for name in sorted(file_list):
+                yield os.path.join(prefix, name)
 
-        for (k, v) in sorted(directory_list):
-            subdir = v.get_directory(self)
-            yield from subdir.__list_prefixed_relative_paths(prefix=os.path.join(prefix, k))
+            for name in sorted(directory_list, reverse=True):
+                subdir = directory.__index[name].get_directory(directory)
+                stack.append((subdir, os.path.join(prefix, name)))
 
     def __get_identifier(self) -> str:
         path = ""
@@ -867,10 +922,7 @@ class CasBasedDirectory(Directory):
         return path
 
     def __find_root(self) -> "CasBasedDirectory":
-        if self.__parent:
-            return self.__parent.__find_root()
-        else:
-            return self
+        return self.__root
 
     def __entry_from_path(self, path: List[str], *, follow_symlinks: bool = False) -> _IndexEntry:
         subdir = self.__open_directory(path[:-1], follow_symlinks=follow_symlinks)
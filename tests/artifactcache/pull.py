@@ -2,6 +2,7 @@
 # pylint: disable=redefined-outer-name
 
 import os
+from collections import deque
 
 import pytest
 
@@ -21,16 +22,17 @@ DATA_DIR = os.path.join(
 
 
 def tree_maker(cas, tree, directory):
-    if tree.root.ByteSize() == 0:
-        tree.root.CopyFrom(directory)
+    tree.root.CopyFrom(directory)
 
-    for directory_node in directory.directories:
-        child_directory = tree.children.add()
+    pending = deque([tree.root])
+    while pending:
+        for directory_node in pending.popleft().directories:
+            child_directory = tree.children.add()
 
-        with open(cas.objpath(directory_node.digest), "rb") as f:
-            child_directory.ParseFromString(f.read())
+            with open(cas.objpath(directory_node.digest), "rb") as f:
+                child_directory.ParseFromString(f.read())
 
-        tree_maker(cas, tree, child_directory)
+            pending.append(child_directory)
 
 
 @pytest.mark.datafiles(DATA_DIR)
@@ -167,7 +167,7 @@ def _test_merge_dirs(
         # We need to strip some types of values, since they're more
         # than our little list comparisons can handle
         def make_info(entry, list_props=None):
-            ret = {k: v for k, v in vars(entry).items() if k not in ("directory", "cas_cache")}
+            ret = {k: getattr(entry, k) for k in entry.__slots__ if k not in ("directory", "cas_cache")}
             if entry.type == FileType.REGULAR_FILE:
                 # Only file digests make sense here (directory digests
                 # need to be re-calculated taking into account their